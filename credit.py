@@ -3,34 +3,27 @@ import os
 import re
 import sys
 import time
-import argparse
+import contextlib
+import functools
 from datetime import datetime
 from colorama import init
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TaskProgressColumn,
-)
-from rich.table import Table
-from rich.markdown import Markdown
-from rich import box
 import shutil
 import configparser
-import platform
-import statistics
 
 init()
 
 console = Console()
 
-if platform.system() == "Windows":
+if sys.platform == "win32":
     CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".credit.conf")
+    CACHE_FILE = os.path.join(os.path.expanduser("~"), ".credit.cache")
 else:
     CONFIG_FILE = os.path.expanduser("~/.credit.conf")
+    CACHE_FILE = os.path.expanduser("~/.credit.cache")
+
+# Bump whenever detection or placement changes what a cached status means
+CACHE_FORMAT = 1
 
 VERSION = "2.3.0"
 
@@ -64,22 +57,41 @@ USERNAME = config["username"]
 GITHUB = config["github"]
 DEFAULT_DIRECTORY = config["directory"]
 
+# Files processed between progress description updates
+PROGRESS_DESCRIPTION_INTERVAL = 50
+
+# Runs with at most this many files are processed inline, without a thread pool
+PARALLEL_THRESHOLD = 32
+
+# The progress bar is redrawn at most once per this many files or seconds
+PROGRESS_BATCH_SIZE = 64
+PROGRESS_REFRESH_INTERVAL = 0.1
+
 # Debug metrics storage
 FILE_PROCESSING_TIMES = {}
 
+# Tuples, so str.endswith can take them as they are
 SUPPORTED_EXTENSIONS = {
-    "javascript": [".js", ".jsx"],
-    "typescript": [".ts", ".tsx"],
-    "golang": [".go"],
-    "python": [".py"],
-    "c": [".c", ".h"],
-    "cpp": [".cpp", ".hpp", ".cc", ".hh"],
-    "java": [".java"],
-    "csharp": [".cs"],
-    "ruby": [".rb"],
-    "php": [".php"],
+    "javascript": (".js", ".jsx"),
+    "typescript": (".ts", ".tsx"),
+    "golang": (".go",),
+    "python": (".py",),
+    "c": (".c", ".h"),
+    "cpp": (".cpp", ".hpp", ".cc", ".hh"),
+    "java": (".java",),
+    "csharp": (".cs",),
+    "ruby": (".rb",),
+    "php": (".php",),
 }
 
+EXT_TO_LANGUAGE = {
+    ext: language
+    for language, extensions in SUPPORTED_EXTENSIONS.items()
+    for ext in extensions
+}
+
+ALL_EXTENSIONS = tuple(EXT_TO_LANGUAGE)
+
 COMMENT_STYLES = {
     "javascript": {
         "block_start": "/*",
@@ -133,83 +145,276 @@ COMMENT_STYLES = {
     },
 }
 
+# Dependency, build and VCS directories that are never descended into
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "dist",
+        "build",
+        ".next",
+        "target",
+    }
+)
+
 IGNORE_PATTERN = r"(?://|#|/\*)\s*credit-ignore"
+IGNORE_RE = re.compile(IGNORE_PATTERN)
+
+# Number of bytes read from the top of a file to decide whether it needs work
+HEAD_SIZE = 8192
+
+# Files larger than this are memory-mapped instead of read when searched in full
+MMAP_THRESHOLD = 64 * 1024
+
+# Number of characters at the top of a file searched for the ignore comment
+IGNORE_SCAN_SIZE = 2048
+
+# Maximum number of characters allowed between the parts of a copyright notice
+COPYRIGHT_MAX_GAP = 500
+
+# Buffer size used when copying the script without a kernel-side copy
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def compile_copyright_pattern(language):
+    """
+    Compile a single copyright detection pattern for a language.
+    Block and line style notices are matched in one alternation so the
+    content is only scanned once, and the gaps are bounded to keep misses cheap.
+    Patterns are compiled on first use, so only languages that are actually
+    encountered pay for it.
+    """
+    style = COMMENT_STYLES.get(language, COMMENT_STYLES["javascript"])
+
+    block_start_escaped = re.escape(style["block_start"])
+    block_end_escaped = re.escape(style["block_end"])
+    line_escaped = re.escape(style["line"])
+    username_escaped = re.escape(USERNAME)
+    # The name sits on the Copyright line (or the one after it), so only the
+    # gap up to the end of the block comment may cross several lines
+    line_gap = f"[^\\n]{{0,{COPYRIGHT_MAX_GAP}}}?"
+    name_gap = f"{line_gap}(?:\\n{line_gap})?"
+    block_gap = f"[\\s\\S]{{0,{COPYRIGHT_MAX_GAP}}}?"
+
+    pattern = (
+        f"(?:{block_start_escaped}\\s*Copyright (?:©|\\(c\\)) (\\d{{4}}){name_gap}{username_escaped}{block_gap}{block_end_escaped})"
+        f"|(?:{line_escaped} Copyright (?:©|\\(c\\)) (\\d{{4}}){line_gap}{username_escaped})"
+    )
+
+    return re.compile(pattern)
+
+
+# A quoted module specifier that cannot run past the end of its line
+JS_MODULE_STRING = r"""(?:'[^'\n]*'|"[^"\n]*")"""
+
+# One import binding: a default name, * as name, or a { ... } list.
+# Each form is delimited, so a failed match never backtracks over the file.
+JS_IMPORT_BINDING = r"(?:[\w$]+|\*\s*as\s+[\w$]+|\{[^{}]*\})"
+
+# Comments, strings and imports lexed in a single pass. Comments and strings
+# are consumed whole, so import-looking text inside them never matches.
+JS_TOKEN_RE = re.compile(
+    "|".join(
+        [
+            # Block and line comments
+            r"(?P<comment>/\*.*?\*/|//[^\n]*)",
+            # Double and single quoted strings
+            r"""(?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')""",
+            "(?P<import>"
+            + "|".join(
+                [
+                    # Standard and type imports: import X from 'Y', import type { X } from 'Y'
+                    rf"import\s+(?:type\s+)?{JS_IMPORT_BINDING}(?:\s*,\s*{JS_IMPORT_BINDING})?\s*from\s*{JS_MODULE_STRING};?",
+                    # Dynamic imports: import('X')
+                    rf"import\s*\({JS_MODULE_STRING}\)",
+                    # Require: const X = require('Y')
+                    rf"(?:const|let|var)\s+(?:[\w$]+|\{{[^{{}}]*\}})\s*=\s*require\s*\({JS_MODULE_STRING}\);?",
+                ]
+            )
+            + ")",
+        ]
+    ),
+    re.DOTALL,
+)
+
+PYTHON_IMPORT_RE = re.compile(
+    r"^import\s+.*?$"  # import x
+    r"|^from\s+.*?\s+import\s+.*?$",  # from x import y
+    re.MULTILINE,
+)
+
+# Whitespace after the last import, up to but excluding a second newline
+PYTHON_IMPORT_TRAILER_RE = re.compile(r"[^\S\n]*(?:\n[^\S\n]*)?")
+
+NON_SPACE_RE = re.compile(r"\S")
+
+IMPORT_PATTERNS = {
+    # import "fmt" or a parenthesised import ( ... ) group
+    "golang": re.compile(r"^import[ \t]*\([^)]*\)|^import[ \t]+\S.*$", re.MULTILINE),
+    # import java.util.List; or import static org.junit.Assert.*;
+    "java": re.compile(
+        r"^import[ \t]+(?:static[ \t]+)?[\w.*]+[ \t]*;", re.MULTILINE
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def compile_copyright_pattern_bytes(language):
+    """Compile the copyright detection pattern for searching raw file bytes."""
+    pattern = compile_copyright_pattern(language)
+    return re.compile(pattern.pattern.encode("utf-8"))
 
 
 def get_copyright_template(language):
     """Get the appropriate copyright template for the language."""
     style = COMMENT_STYLES.get(language, COMMENT_STYLES["javascript"])
 
-    if language == "python":
-        return f"""{style["block_start"]}
+    return f"""{style["block_start"]}
 Copyright © {{year}} {{name}} ({{github}})
 
 Not to be shared, replicated, or used without prior consent.
 Contact me for any enquiries
 {style["block_end"]}"""
-    else:
-        return f"""{style["block_start"]}
-Copyright © {{year}} {{name}} ({{github}})
 
-Not to be shared, replicated, or used without prior consent.
-Contact me for any enquiries
-{style["block_end"]}"""
+
+COPYRIGHT_TEMPLATES = {
+    language: get_copyright_template(language) for language in COMMENT_STYLES
+}
+
+
+@functools.lru_cache(maxsize=32)
+def render_copyright_notice(language, year, name, github):
+    """Render the copyright notice for a language, reusing it across files."""
+    return COPYRIGHT_TEMPLATES[language].format(year=year, name=name, github=github)
 
 
 def get_language_from_extension(extension):
     """Determine the language based on file extension."""
-    for language, extensions in SUPPORTED_EXTENSIONS.items():
-        if extension in extensions:
-            return language
-    return "javascript"  # Default to JavaScript
+    return EXT_TO_LANGUAGE.get(extension, "javascript")  # Default to JavaScript
+
+
+def get_language_from_path(file_path):
+    """
+    Determine the language of a file from its path.
+    Anything after the last dot that is not a supported extension falls back to
+    the default, so the separator scan in os.path.splitext can be skipped.
+    """
+    return get_language_from_extension("." + file_path.rpartition(".")[2])
 
 
 def find_files(directory, extensions, recursive=True):
     """Find all files with the specified extensions in the given directory."""
     matched_files = []
+    # A no-op for the tuples in SUPPORTED_EXTENSIONS and ALL_EXTENSIONS
+    extension_suffixes = tuple(extensions)
+    pending_dirs = [directory]
 
-    if recursive:
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if any(file.endswith(ext) for ext in extensions):
-                    matched_files.append(os.path.join(root, file))
-    else:
-        for file in os.listdir(directory):
-            file_path = os.path.join(directory, file)
-            if os.path.isfile(file_path) and any(
-                file.endswith(ext) for ext in extensions
-            ):
-                matched_files.append(file_path)
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            entries = os.scandir(current_dir)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and entry.name not in SKIP_DIRS:
+                        pending_dirs.append(entry.path)
+                elif entry.name.endswith(extension_suffixes) and entry.is_file():
+                    matched_files.append(entry.path)
 
     return matched_files
 
 
+def get_relative_path(file_path, cwd_prefix):
+    """
+    Get a file path relative to the working directory for display.
+    cwd_prefix is the working directory with a trailing separator, computed once
+    per run so most paths can be sliced instead of going through os.path.relpath.
+    """
+    if not os.path.isabs(file_path):
+        return os.path.normpath(file_path)
+    if file_path.startswith(cwd_prefix):
+        return file_path[len(cwd_prefix):]
+    return os.path.relpath(file_path)
+
+
+def read_file_head(file_path, size=HEAD_SIZE):
+    """
+    Read the beginning of a file, which is where notices and ignore comments live.
+    Returns the decoded text and whether it is the whole file; most source files
+    fit in the head, so they never need a second read.
+    """
+    # Raw reads on the descriptor: one fixed-size read of the head, plus a
+    # one-byte probe for the end of the file when the head came back short
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size)
+        # A short read is not proof of the end of the file on every filesystem,
+        # so only an empty follow-up read counts as reaching it
+        whole = len(data) < size and not os.read(fd, 1)
+    finally:
+        os.close(fd)
+
+    head = data.decode("utf-8", errors="surrogateescape")
+
+    if whole:
+        # Translated like a text-mode read, so the reused head and a full read
+        # write back the same newlines
+        head = head.replace("\r\n", "\n").replace("\r", "\n")
+
+    return head, whole
+
+
 def should_ignore_file(content):
-    """Check if a file should be ignored based on the ignore comment."""
-    return bool(re.search(IGNORE_PATTERN, content))
+    """Check if a file should be ignored based on the ignore comment at its top."""
+    # A plain substring probe rules out almost every file before the regex runs
+    if content.find("credit-ignore", 0, IGNORE_SCAN_SIZE) == -1:
+        return False
+    return IGNORE_RE.search(content, 0, IGNORE_SCAN_SIZE) is not None
 
 
 def check_existing_copyright(content, language):
-    """Check if a file already has a copyright notice and extract its year."""
-    style = COMMENT_STYLES.get(language, COMMENT_STYLES["javascript"])
+    """
+    Check if a file already has a copyright notice and extract its year.
+    Returns whether a notice was found, its year and its (start, end) span.
+    """
+    match = compile_copyright_pattern(language).search(content)
+    if match:
+        return True, match.group(1) or match.group(2), match.span()
 
-    block_start_escaped = re.escape(style["block_start"])
-    block_end_escaped = re.escape(style["block_end"])
-    line_escaped = re.escape(style["line"])
+    return False, None, None
 
-    patterns = [
-        f"{block_start_escaped}\\s*Copyright © (\\d{{4}}).*?{USERNAME}.*?{block_end_escaped}",
-        f"{block_start_escaped}\\s*Copyright \\(c\\) (\\d{{4}}).*?{USERNAME}.*?{block_end_escaped}",
-        f"{line_escaped} Copyright © (\\d{{4}}).*?{USERNAME}",
-        f"{line_escaped} Copyright \\(c\\) (\\d{{4}}).*?{USERNAME}",
-    ]
 
-    for pattern in patterns:
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            return True, match.group(1), match.group(0)
+def find_copyright_in_file(file_path, language):
+    """
+    Search a whole file for a copyright notice without decoding it.
+    Large files are memory-mapped so the regex reads straight from the page cache.
+    Returns whether a notice was found and its year.
+    """
+    import mmap
 
-    return False, None, None
+    pattern = compile_copyright_pattern_bytes(language)
+
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return extract_copyright_year(pattern.search(data))
+
+        return extract_copyright_year(pattern.search(file.read()))
+
+
+def extract_copyright_year(match):
+    """Turn a bytes copyright match into a (found, year) pair."""
+    if match:
+        return True, (match.group(1) or match.group(2)).decode("ascii")
+
+    return False, None
 
 
 def detect_import_blocks(content, language):
@@ -218,100 +423,46 @@ def detect_import_blocks(content, language):
     Returns the position after the last import statement.
     """
     if language in ["javascript", "typescript"]:
-        import_patterns = [
-            # Standard imports: import X from 'Y'
-            r'import\s+[\w\s{},*]+\s+from\s+[\'"].*?[\'"];?',
-            # Dynamic imports: import('X')
-            r'import\s*\([\'"].*?[\'"]\)',
-            # Require: const X = require('Y')
-            r'(?:const|let|var)\s+[\w\s{}]+\s*=\s*require\s*\([\'"].*?[\'"]\);?',
-            # Import type: import type { X } from 'Y'
-            r'import\s+type\s+[\w\s{},*]+\s+from\s+[\'"].*?[\'"];?',
-        ]
-        
-        combined_pattern = '|'.join(f'({p})' for p in import_patterns)
-        
-        all_imports = list(re.finditer(combined_pattern, content, re.DOTALL | re.MULTILINE))
-        
-        if not all_imports:
+        last_import_end = 0
+        for token in JS_TOKEN_RE.finditer(content):
+            if token.lastgroup == "import":
+                last_import_end = token.end()
+
+        if not last_import_end:
             return 0
-        
-        imports_to_check = []
-        
-        for import_match in all_imports:
-            start_pos = import_match.start()
-            end_pos = import_match.end()
-            
-            # Check if this import is inside a comment block or string
-            in_comment = False
-            for pattern in [r'/\*.*?\*/', r'//.*?(?:\n|$)', r'".*?"', r"'.*?'"]:
-                comment_matches = list(re.finditer(pattern, content, re.DOTALL))
-                for comment_match in comment_matches:
-                    comment_start = comment_match.start()
-                    comment_end = comment_match.end()
-                    if comment_start <= start_pos and end_pos <= comment_end:
-                        in_comment = True
-                        break
-                if in_comment:
-                    break
-            
-            if not in_comment:
-                imports_to_check.append((start_pos, end_pos))
-        
-        # If we have valid imports, find the last one
-        if imports_to_check:
-            # Sort by end position to find the last one
-            imports_to_check.sort(key=lambda x: x[1])
-            _, last_import_end = imports_to_check[-1]
-            
-            match = re.search(r'\S', content[last_import_end:])
-            if match:
-                return last_import_end + match.start()
-            else:
-                return last_import_end
-        
-        return 0
+
+        match = NON_SPACE_RE.search(content, last_import_end)
+        if match:
+            return match.start()
+        else:
+            return last_import_end
     
     elif language == "python":
-        import_patterns = [
-            r'^import\s+.*?$',  # import x
-            r'^from\s+.*?\s+import\s+.*?$',  # from x import y
-        ]
-        
-        combined_pattern = '|'.join(import_patterns)
-        all_imports = list(re.finditer(combined_pattern, content, re.MULTILINE))
-        
-        if not all_imports:
+        last_import_end = 0
+        for match in PYTHON_IMPORT_RE.finditer(content):
+            last_import_end = match.end()
+
+        if not last_import_end:
             return 0
-            
-        all_imports.sort(key=lambda x: x.end())
-        last_import_end = all_imports[-1].end()
-        
-        newline_count = 0
-        index = last_import_end
-        
-        while index < len(content):
-            if content[index].isspace():
-                if content[index] == '\n':
-                    newline_count += 1
-                    if newline_count > 1:  # Two consecutive newlines end the import block
-                        break
-                index += 1
-            else:
-                break
-        
-        return index
+
+        # Two consecutive newlines end the import block
+        return PYTHON_IMPORT_TRAILER_RE.match(content, last_import_end).end()
     
-    # Default fallback for other languages
-    else:
-        imports_pattern = r'^import.*?$|^.*?from.*?import.*?$'
-        matches = list(re.finditer(imports_pattern, content, re.MULTILINE))
-        
-        if matches:
-            last_import_end = matches[-1].end()
-            return last_import_end
-        
-        return 0
+    # Other languages with import statements; the rest have no import block
+    elif language in IMPORT_PATTERNS:
+        last_import_end = 0
+        for match in IMPORT_PATTERNS[language].finditer(content, 0, HEAD_SIZE):
+            last_import_end = match.end()
+
+        return last_import_end
+
+    return 0
+
+
+def write_file_parts(file_path, parts):
+    """Write a file from a list of text pieces without joining them first."""
+    with open(file_path, "w", encoding="utf-8", errors="surrogateescape") as file:
+        file.writelines(parts)
 
 
 def add_or_update_copyright(
@@ -319,80 +470,227 @@ def add_or_update_copyright(
 ):
     """Add or update copyright notice in a file."""
     start_time = time.time()
-    
+
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            content = file.read()
-    except UnicodeDecodeError:
-        try:
-            with open(file_path, "r", encoding="latin-1") as file:
-                content = file.read()
-        except Exception as e:
-            return "error", f"Encoding error: {str(e)}"
+        head, whole = read_file_head(file_path)
     except Exception as e:
         return "error", str(e)
 
-    if should_ignore_file(content):
+    if should_ignore_file(head):
         FILE_PROCESSING_TIMES[file_path] = time.time() - start_time
         return "ignored", None
 
-    _, extension = os.path.splitext(file_path)
-    language = get_language_from_extension(extension)
+    language = get_language_from_path(file_path)
 
-    username = custom_username or USERNAME
-    github = custom_github or GITHUB
-
-    has_copyright, year, old_notice = check_existing_copyright(content, language)
+    has_copyright, year, notice_span = check_existing_copyright(head, language)
 
     if has_copyright and year == str(CURRENT_YEAR) and not force_update:
         FILE_PROCESSING_TIMES[file_path] = time.time() - start_time
         return "skipped", None
 
-    copyright_notice = get_copyright_template(language).format(
-        year=CURRENT_YEAR, name=username, github=github
+    if whole:
+        content = head
+    else:
+        # A rewrite is likely, so load the whole file and re-check against it.
+        # Bytes that are not valid UTF-8 are carried through as surrogates and
+        # written back unchanged, so one open covers every encoding.
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="surrogateescape") as file:
+                content = file.read()
+        except Exception as e:
+            return "error", str(e)
+
+        has_copyright, year, notice_span = check_existing_copyright(content, language)
+
+        if has_copyright and year == str(CURRENT_YEAR) and not force_update:
+            FILE_PROCESSING_TIMES[file_path] = time.time() - start_time
+            return "skipped", None
+
+    username = custom_username or USERNAME
+    github = custom_github or GITHUB
+
+    copyright_notice = render_copyright_notice(
+        language, CURRENT_YEAR, username, github
     )
 
     if has_copyright:
-        modified_content = content.replace(old_notice, copyright_notice)
-
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(modified_content)
+        notice_start, notice_end = notice_span
+        try:
+            write_file_parts(
+                file_path,
+                [content[:notice_start], copyright_notice, content[notice_end:]],
+            )
+        except OSError as e:
+            return "error", str(e)
 
         FILE_PROCESSING_TIMES[file_path] = time.time() - start_time
         return "updated", year
 
     if language == "python" and content.startswith("#!"):
-        shebang_end = content.find("\n") + 1
-        modified_content = (
-            content[:shebang_end]
-            + "\n"
-            + copyright_notice
-            + "\n\n"
-            + content[shebang_end:]
-        )
+        shebang, _, rest = content.partition("\n")
+        parts = [shebang, "\n\n", copyright_notice, "\n\n", rest]
     else:
         imports_end = detect_import_blocks(content, language)
 
         if imports_end > 0:
-            modified_content = (
-                content[:imports_end]
-                + "\n\n"
-                + copyright_notice
-                + "\n\n"
-                + content[imports_end:].lstrip()
-            )
+            # Skip the whitespace after the imports without copying the tail twice
+            body = NON_SPACE_RE.search(content, imports_end)
+            body_start = body.start() if body else len(content)
+            parts = [
+                content[:imports_end],
+                "\n\n",
+                copyright_notice,
+                "\n\n",
+                content[body_start:],
+            ]
         else:
-            modified_content = copyright_notice + "\n\n" + content
+            parts = [copyright_notice, "\n\n", content]
 
-    with open(file_path, "w", encoding="utf-8") as file:
-        file.write(modified_content)
+    try:
+        write_file_parts(file_path, parts)
+    except OSError as e:
+        return "error", str(e)
 
     FILE_PROCESSING_TIMES[file_path] = time.time() - start_time
     return "added", None
 
 
+def load_cache():
+    """
+    Load the cache of files already processed this year.
+    The cache is discarded when it was written for another year, user, version or
+    cache format, since any of those change what counts as an up-to-date notice.
+    A cache that does not have the expected shape is treated as empty.
+    """
+    import json
+
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or (
+        data.get("year"),
+        data.get("username"),
+        data.get("version"),
+        data.get("format"),
+    ) != (CURRENT_YEAR, USERNAME, VERSION, CACHE_FORMAT):
+        return {}
+
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return {}
+
+    return files
+
+
+def prune_cache(cache, directory, seen, extensions, recursive):
+    """
+    Drop cache entries for files that a walk of directory would have found but
+    did not, which means they were deleted. Entries for other trees, and for
+    files this run's language or recursion options left out, are kept.
+    """
+    root = os.path.abspath(directory)
+    root_prefix = os.path.join(root, "")
+
+    deleted = [
+        path
+        for path in cache
+        if path.startswith(root_prefix)
+        and path not in seen
+        and path.endswith(extensions)
+        and (recursive or os.path.dirname(path) == root)
+    ]
+    for path in deleted:
+        del cache[path]
+
+
+def save_cache(cache):
+    """
+    Save the processed-file cache for the next run.
+    It is written to a temporary file and renamed into place, so a concurrent
+    run never reads a half-written cache.
+    """
+    import json
+    import tempfile
+
+    data = {
+        "year": CURRENT_YEAR,
+        "username": USERNAME,
+        "version": VERSION,
+        "format": CACHE_FORMAT,
+        "files": cache,
+    }
+
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(CACHE_FILE), prefix=".credit-", suffix=".tmp"
+        )
+    except OSError:
+        return  # The cache is only an optimisation
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, CACHE_FILE)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+
+
+def process_file_cached(
+    file_path, cache, force_update=False, custom_username=None, custom_github=None
+):
+    """
+    Process a file unless the cache shows it is unchanged since it was last handled.
+    Cache entries map an absolute path to [mtime_ns, size, status], so a hit
+    costs a single stat instead of reading the file.
+    """
+    start_time = time.time()
+    cache_key = os.path.abspath(file_path)
+
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        stat = None
+
+    if stat is not None and not force_update:
+        entry = cache.get(cache_key)
+        # Anything but a well-formed entry is simply a miss
+        if (
+            isinstance(entry, list)
+            and len(entry) == 3
+            and entry[0] == stat.st_mtime_ns
+            and entry[1] == stat.st_size
+        ):
+            FILE_PROCESSING_TIMES[file_path] = time.time() - start_time
+            return ("ignored" if entry[2] == "ignored" else "skipped"), None
+
+    status, extra_info = add_or_update_copyright(
+        file_path, force_update, custom_username, custom_github
+    )
+
+    # Notices written under another name are not recognised as current later on
+    if status == "error" or custom_username or custom_github:
+        return status, extra_info
+
+    if status in ("added", "updated"):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
+
+    if stat is not None:
+        cache[cache_key] = [stat.st_mtime_ns, stat.st_size, status]
+
+    return status, extra_info
+
+
 def print_header():
     """Print a styled header for the CLI tool."""
+    from rich.panel import Panel
+
     console.print("")
     console.print(
         Panel(
@@ -405,16 +703,10 @@ def print_header():
     )
 
 
-def get_all_extensions():
-    """Get all supported file extensions."""
-    all_extensions = []
-    for extensions in SUPPORTED_EXTENSIONS.values():
-        all_extensions.extend(extensions)
-    return all_extensions
-
-
 def print_stats(stats):
     """Print statistics of the operation."""
+    from rich.table import Table
+
     table = Table(title="Operation Summary", border_style=AQUA)
 
     table.add_column("Category", style="dim")
@@ -433,15 +725,36 @@ def print_stats(stats):
 
 def print_debug_stats():
     """Print debug statistics about file processing times."""
+    import heapq
+    import math
+    import statistics
+    from rich.table import Table
+
     if not FILE_PROCESSING_TIMES:
         console.print("[yellow]No timing data available.[/yellow]")
         return
     
-    times = list(FILE_PROCESSING_TIMES.values())
-    total_time = sum(times)
-    avg_time = total_time / len(times)
+    # Mean, variance (Welford), minimum and maximum in a single pass
+    count = 0
+    total_time = 0.0
+    avg_time = 0.0
+    sum_squares = 0.0
+    min_time = math.inf
+    max_time = -math.inf
+    for proc_time in FILE_PROCESSING_TIMES.values():
+        count += 1
+        total_time += proc_time
+        delta = proc_time - avg_time
+        avg_time += delta / count
+        sum_squares += delta * (proc_time - avg_time)
+        if proc_time < min_time:
+            min_time = proc_time
+        if proc_time > max_time:
+            max_time = proc_time
     
-    longest_file = max(FILE_PROCESSING_TIMES.items(), key=lambda x: x[1])
+    # A bounded heap finds the slowest files without sorting every timing
+    top_files = heapq.nlargest(5, FILE_PROCESSING_TIMES.items(), key=lambda x: x[1])
+    longest_file = top_files[0]
     
     table = Table(title="Processing Time Statistics", border_style=AQUA)
     
@@ -450,11 +763,12 @@ def print_debug_stats():
     
     table.add_row("Total processing time", f"{total_time:.4f} seconds")
     table.add_row("Average time per file", f"{avg_time:.4f} seconds")
-    table.add_row("Median time", f"{statistics.median(times):.4f} seconds")
-    if len(times) > 1:
-        table.add_row("Standard deviation", f"{statistics.stdev(times):.4f} seconds")
-    table.add_row("Minimum time", f"{min(times):.4f} seconds")
-    table.add_row("Maximum time", f"{max(times):.4f} seconds")
+    # The median needs the values in order; median sorts them itself
+    table.add_row("Median time", f"{statistics.median(FILE_PROCESSING_TIMES.values()):.4f} seconds")
+    if count > 1:
+        table.add_row("Standard deviation", f"{math.sqrt(sum_squares / (count - 1)):.4f} seconds")
+    table.add_row("Minimum time", f"{min_time:.4f} seconds")
+    table.add_row("Maximum time", f"{max_time:.4f} seconds")
     table.add_row("Longest file", os.path.relpath(longest_file[0]))
     table.add_row("Longest file time", f"{longest_file[1]:.4f} seconds")
     
@@ -462,8 +776,6 @@ def print_debug_stats():
     console.print(table)
     
     if len(FILE_PROCESSING_TIMES) > 5:
-        top_files = sorted(FILE_PROCESSING_TIMES.items(), key=lambda x: x[1], reverse=True)[:5]
-        
         detail_table = Table(title="Top 5 Longest Processing Files", border_style=AQUA)
         detail_table.add_column("File", style="dim")
         detail_table.add_column("Time (seconds)", style="bold")
@@ -488,6 +800,8 @@ def create_config(username, github, directory):
 
 def print_config():
     """Print the current configuration."""
+    from rich.table import Table
+
     table = Table(title="Current Configuration", border_style=AQUA)
 
     table.add_column("Setting", style="dim")
@@ -504,6 +818,11 @@ def print_config():
 
 def print_help():
     """Print detailed help information about the tool with enhanced styling."""
+    from rich import box
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.table import Table
+
     console.print("")
     console.print(
         Panel(
@@ -579,6 +898,7 @@ def print_help():
     options_table.add_row("--detailed-help", "Show this detailed help message")
     options_table.add_row("--install", "Install as system command")
     options_table.add_row("--debug", "Show processing time statistics")
+    options_table.add_row("--no-cache", "Re-check files the cache marks as unchanged")
 
     console.print(
         Panel(
@@ -591,7 +911,8 @@ def print_help():
 
     console.print(
         Panel(
-            "Add the comment [bold cyan]// credit-ignore[/bold cyan] at the top of any file to exclude it from processing.",
+            "Add the comment [bold cyan]// credit-ignore[/bold cyan] at the top of any file to exclude it from processing.\n"
+            f"These directories are always skipped: [bold cyan]{', '.join(sorted(SKIP_DIRS))}[/bold cyan]",
             title="[bold]FILE EXCLUSION[/bold]",
             border_style=AQUA,
             padding=(1, 2),
@@ -627,6 +948,10 @@ Your current configuration is stored at [italic]{CONFIG_FILE}[/italic]
 
 def print_version():
     """Print the version information."""
+    import platform
+    from rich import box
+    from rich.table import Table
+
     table = Table(show_header=False, box=box.SIMPLE)
 
     table.add_column(style="dim")
@@ -642,38 +967,56 @@ def print_version():
 
 def preview_changes(files, force_update=False):
     """Preview changes without applying them."""
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Preview of Changes", border_style=AQUA)
 
+    # Built once and shared by every row, so no cell goes through the markup
+    # parser; paths are shown as they are even if they contain brackets
+    cannot_read = Text("Cannot read file", style="red")
+    will_ignore = Text("Will be ignored", style="yellow")
+    up_to_date = Text("Up to date", style="cyan")
+    will_add = Text("Will add copyright", style="green")
+
     table.add_column("File", style="dim")
     table.add_column("Action", style="bold")
 
+    cwd_prefix = os.path.join(os.getcwd(), "")
+
     for file_path in files:
-        relative_path = os.path.relpath(file_path)
+        relative_path = Text(get_relative_path(file_path, cwd_prefix))
 
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
+            head, whole = read_file_head(file_path)
         except Exception:
-            table.add_row(relative_path, "[red]Cannot read file[/red]")
+            table.add_row(relative_path, cannot_read)
             continue
 
-        if should_ignore_file(content):
-            table.add_row(relative_path, "[yellow]Will be ignored[/yellow]")
+        if should_ignore_file(head):
+            table.add_row(relative_path, will_ignore)
             continue
 
-        _, extension = os.path.splitext(file_path)
-        language = get_language_from_extension(extension)
+        language = get_language_from_path(file_path)
+
+        has_copyright, year, _ = check_existing_copyright(head, language)
 
-        has_copyright, year, _ = check_existing_copyright(content, language)
+        if not has_copyright and not whole:
+            # The notice may sit further down, e.g. after a long import block
+            try:
+                has_copyright, year = find_copyright_in_file(file_path, language)
+            except Exception:
+                table.add_row(relative_path, cannot_read)
+                continue
 
         if has_copyright and year == str(CURRENT_YEAR) and not force_update:
-            table.add_row(relative_path, "[cyan]Up to date[/cyan]")
+            table.add_row(relative_path, up_to_date)
         elif has_copyright:
             table.add_row(
-                relative_path, f"[blue]Will update ({year} → {CURRENT_YEAR})[/blue]"
+                relative_path, Text(f"Will update ({year} → {CURRENT_YEAR})", style="blue")
             )
         else:
-            table.add_row(relative_path, "[green]Will add copyright[/green]")
+            table.add_row(relative_path, will_add)
 
     console.print("\n")
     console.print(table)
@@ -681,7 +1024,7 @@ def preview_changes(files, force_update=False):
 
 def update_system_path_permanently(path_to_add):
     """Update the system PATH environment variable permanently."""
-    if platform.system() == "Windows":
+    if sys.platform == "win32":
         try:
             import winreg
 
@@ -738,6 +1081,18 @@ def update_system_path_permanently(path_to_add):
 
 
 def main():
+    # The single-flag info commands do not need the parser built first
+    if sys.argv[1:] == ["--version"]:
+        print_version()
+        return
+
+    if sys.argv[1:] == ["--detailed-help"]:
+        print_header()
+        print_help()
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="credit",
         description="Add or update copyright notices in code files",
@@ -747,16 +1102,18 @@ Use 'credit --detailed-help' to see complete documentation.
         """,
     )
 
+    # The positional and -d/--directory share one destination; the positional
+    # is suppressed when absent so it never overwrites a value given with -d
     parser.add_argument(
         "directory",
         nargs="?",
         help="Path to the source directory (default: from config or ./src)",
-        default=None,
+        default=argparse.SUPPRESS,
     )
     parser.add_argument(
         "-d",
         "--directory",
-        dest="dir_option",
+        dest="directory",
         help="Path to the source directory (alternative to positional arg)",
         default=None,
     )
@@ -809,6 +1166,11 @@ Use 'credit --detailed-help' to see complete documentation.
     parser.add_argument(
         "--debug", help="Show processing time statistics", action="store_true"
     )
+    parser.add_argument(
+        "--no-cache",
+        help="Re-check every file instead of skipping unchanged ones",
+        action="store_true",
+    )
 
     args = parser.parse_args()
 
@@ -838,6 +1200,8 @@ Use 'credit --detailed-help' to see complete documentation.
         return
 
     if args.info:
+        from rich.panel import Panel
+
         print_header()
         console.print(
             Panel(
@@ -855,7 +1219,7 @@ Use 'credit --detailed-help' to see complete documentation.
 
     print_header()
 
-    directory = args.directory or args.dir_option or DEFAULT_DIRECTORY
+    directory = args.directory or DEFAULT_DIRECTORY
 
     if args.file:
         if not os.path.isfile(args.file):
@@ -873,7 +1237,7 @@ Use 'credit --detailed-help' to see complete documentation.
             return
 
         if args.language == "all":
-            extensions = get_all_extensions()
+            extensions = ALL_EXTENSIONS
         else:
             extensions = SUPPORTED_EXTENSIONS[args.language]
 
@@ -904,117 +1268,289 @@ Use 'credit --detailed-help' to see complete documentation.
         "errors": 0,
     }
 
+    # Only needed for an actual run, so --install and the info commands skip it
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    cache = {} if args.no_cache else load_cache()
+
+    # Per-file work is mostly blocking I/O that releases the GIL, but for a
+    # handful of files starting the workers costs more than it saves
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    if len(files) > PARALLEL_THRESHOLD:
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    else:
+        pool = contextlib.nullcontext()
+
+    from rich.progress import (
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        BarColumn,
+        TaskProgressColumn,
+    )
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(bar_width=None),
         TaskProgressColumn(),
         console=console,
-    ) as progress:
+        auto_refresh=False,
+    ) as progress, pool as executor:
         task = progress.add_task("[cyan]Processing files...", total=len(files))
 
-        for file_path in files:
-            relative_path = os.path.relpath(file_path)
-            status, extra_info = add_or_update_copyright(
-                file_path, args.force, args.username, args.github
+        def process(file_path):
+            """Process one file, turning any failure into that file's error."""
+            try:
+                return process_file_cached(
+                    file_path, cache, args.force, args.username, args.github
+                )
+            except Exception as e:
+                return "error", str(e)
+
+        if executor is None:
+            results = ((file_path, process(file_path)) for file_path in files)
+        else:
+            futures = {executor.submit(process, file_path): file_path for file_path in files}
+            results = (
+                (futures[future], future.result()) for future in as_completed(futures)
             )
+        cwd_prefix = os.path.join(os.getcwd(), "")
 
-            if status in stats:
-                stats[status] += 1
+        # Advances are batched and the bar is redrawn by hand, so fast runs
+        # are not dominated by rendering
+        pending = 0
+        last_refresh = time.monotonic()
 
-            if status == "added":
-                progress.update(
-                    task, description=f"[green]Added copyright to {relative_path}"
-                )
-            elif status == "updated":
-                progress.update(
-                    task,
-                    description=f"[blue]Updated copyright ({extra_info} → {CURRENT_YEAR}) in {relative_path}",
-                )
-            elif status == "skipped":
-                progress.update(
-                    task, description=f"[cyan]Skipped {relative_path} (up to date)"
-                )
-            elif status == "ignored":
-                progress.update(
-                    task,
-                    description=f"[yellow]Ignored {relative_path} (credit-ignore found)",
-                )
-            elif status == "error":
-                progress.update(
-                    task,
-                    description=f"[red]Error processing {relative_path}: {extra_info}",
-                )
+        # Failures are listed together once the run is over
+        errors = []
 
-            progress.update(task, advance=1)
+        try:
+            for index, (file_path, (status, extra_info)) in enumerate(results):
+                if status == "error":
+                    errors.append((file_path, extra_info))
+                else:
+                    stats[status] += 1
+
+                pending += 1
+
+                # The description is only refreshed periodically, which is all
+                # the eye can follow
+                if not index % PROGRESS_DESCRIPTION_INTERVAL:
+                    relative_path = get_relative_path(file_path, cwd_prefix)
+
+                    if status == "added":
+                        description = f"[green]Added copyright to {relative_path}"
+                    elif status == "updated":
+                        description = f"[blue]Updated copyright ({extra_info} → {CURRENT_YEAR}) in {relative_path}"
+                    elif status == "skipped":
+                        description = f"[cyan]Skipped {relative_path} (up to date)"
+                    elif status == "ignored":
+                        description = f"[yellow]Ignored {relative_path} (credit-ignore found)"
+                    else:
+                        description = f"[red]Error processing {relative_path}: {extra_info}"
+
+                    progress.update(task, description=description)
+
+                now = time.monotonic()
+                if (
+                    pending >= PROGRESS_BATCH_SIZE
+                    or now - last_refresh > PROGRESS_REFRESH_INTERVAL
+                ):
+                    progress.update(task, advance=pending)
+                    progress.refresh()
+                    pending = 0
+                    last_refresh = now
+
+            progress.update(task, advance=pending)
+        except BaseException:
+            # Drop queued files instead of waiting for the whole pool to drain,
+            # whether the run was interrupted or failed outside a single file
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    stats["errors"] = len(errors)
+
+    if errors:
+        from rich.markup import escape
+
+        console.print(
+            "\n".join(
+                f"[red]Error processing {escape(get_relative_path(file_path, cwd_prefix))}: {escape(error)}[/red]"
+                for file_path, error in sorted(errors)
+            )
+        )
+
+    if not args.no_cache:
+        if not args.file:
+            seen = {os.path.abspath(file_path) for file_path in files}
+            prune_cache(cache, directory, seen, extensions, not args.no_recursive)
+        save_cache(cache)
 
     print_stats(stats)
     if args.debug:
         print_debug_stats()
 
 
+def fastcopy(src, dst):
+    """
+    Copy a file, letting the kernel move the data where it can.
+    On Linux copy_file_range can clone (reflink) or copy inside the kernel, with
+    sendfile as the next best in-kernel copy; elsewhere shutil.copy2 already
+    uses fcopyfile (macOS) or CopyFile2 (Windows).
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src, dst)
+        return
+
+    import errno
+
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        remaining = os.fstat(src_fd).st_size
+
+        # Both calls copy from and advance the current offsets, so a later one
+        # carries on from wherever an unsupported earlier one stopped
+        kernel_copies = [
+            lambda count: os.copy_file_range(src_fd, dst_fd, count),
+            lambda count: os.sendfile(dst_fd, src_fd, None, count),
+        ]
+
+        for kernel_copy in kernel_copies:
+            try:
+                while remaining > 0:
+                    copied = kernel_copy(remaining)
+                    if not copied:
+                        # Some filesystems report 0 without having copied
+                        # anything, so this is not taken to mean done
+                        break
+                    remaining -= copied
+            except OSError as e:
+                if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+
+            if remaining <= 0:
+                return
+
+        # Neither kernel copy finished, whether it was unsupported or stopped
+        # short (sendfile included), so copy the rest through a buffer
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        while True:
+            read = fsrc.readinto(buffer)
+            if not read:
+                break
+            fdst.write(view[:read])
+            remaining -= read
+
+        if remaining > 0:
+            raise OSError(errno.EIO, f"Short copy: {remaining} bytes of {src} missing")
+
+
+def install_file(src, dst, mode=None):
+    """
+    Copy a file into place atomically.
+    The copy is written to a temporary file beside the destination and renamed
+    over it, so a running copy of the old script never sees a half-written file.
+    """
+    import tempfile
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(dst), prefix=".credit-", suffix=".tmp"
+    )
+    os.close(fd)
+
+    try:
+        fastcopy(src, temp_path)
+
+        # The rename would turn a failed copy into a broken install
+        copied_size = os.path.getsize(temp_path)
+        if copied_size != os.path.getsize(src):
+            raise OSError(f"Incomplete copy of {src} ({copied_size} bytes)")
+
+        # mkstemp creates the file as 0600, so the mode is always set
+        if mode is None:
+            shutil.copymode(src, temp_path)
+        else:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, dst)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
 def install_script():
     """Install the script as a system command."""
     script_path = os.path.abspath(__file__)
+    # ~/bin is the Windows install location and the Unix fallback
+    user_bin_dir = os.path.join(os.path.expanduser("~"), "bin")
 
-    if platform.system() == "Windows":
-        user_bin_dir = os.path.join(os.path.expanduser("~"), "bin")
-        os.makedirs(user_bin_dir, exist_ok=True)
+    if sys.platform == "win32":
+        if not os.path.isdir(user_bin_dir):
+            os.makedirs(user_bin_dir, exist_ok=True)
 
         script_dest = os.path.join(user_bin_dir, "credit.py")
         batch_path = os.path.join(user_bin_dir, "credit.bat")
 
-        shutil.copy2(script_path, script_dest)
+        install_file(script_path, script_dest)
 
+        # A single @-prefixed line needs no echo off; %~dp0 is the batch
+        # file's own directory, where the script was just copied
         with open(batch_path, "w") as f:
-            f.write(f'@echo off\npython "{script_dest}" %*')
+            f.write('@python "%~dp0credit.py" %*')
 
         success, message = update_system_path_permanently(user_bin_dir)
 
+        # Each outcome is rendered in one call rather than line by line
         if success:
-            console.print(f"[green]Script installed at {script_dest}[/green]")
-            console.print(f"[green]Batch file created at {batch_path}[/green]")
-            console.print(f"[green]{message}[/green]")
-            console.print(
-                "[yellow]You may need to restart your command prompt for the changes to take effect.[/yellow]"
-            )
+            messages = [
+                f"[green]Script installed at {script_dest}[/green]",
+                f"[green]Batch file created at {batch_path}[/green]",
+                f"[green]{message}[/green]",
+                "[yellow]You may need to restart your command prompt for the changes to take effect.[/yellow]",
+            ]
         else:
-            console.print(f"[red]Error adding to PATH: {message}[/red]")
-            console.print(f"[yellow]Script installed at {script_dest}[/yellow]")
-            console.print(f"[yellow]Batch file created at {batch_path}[/yellow]")
-            console.print(
-                "[yellow]To use from any directory, add this directory to your PATH manually:[/yellow]"
-            )
-            console.print(f"[blue]{user_bin_dir}[/blue]")
+            messages = [
+                f"[red]Error adding to PATH: {message}[/red]",
+                f"[yellow]Script installed at {script_dest}[/yellow]",
+                f"[yellow]Batch file created at {batch_path}[/yellow]",
+                "[yellow]To use from any directory, add this directory to your PATH manually:[/yellow]",
+                f"[blue]{user_bin_dir}[/blue]",
+            ]
+        console.print("\n".join(messages))
     else:
         # For Unix-like systems
         dest_path = "/usr/local/bin/credit"
         try:
-            shutil.copy(script_path, dest_path)
-            os.chmod(dest_path, 0o755)
+            install_file(script_path, dest_path, 0o755)
             console.print(f"[green]Successfully installed at {dest_path}[/green]")
         except PermissionError:
-            console.print("[red]Permission denied. Try running with sudo.[/red]")
             console.print(
+                "[red]Permission denied. Try running with sudo.[/red]\n"
                 f"[yellow]To install, run: sudo cp {script_path} {dest_path} && sudo chmod +x {dest_path}[/yellow]"
             )
         except Exception as e:
             console.print(f"[red]Error installing: {str(e)}[/red]")
 
-            user_bin = os.path.expanduser("~/bin")
-            os.makedirs(user_bin, exist_ok=True)
-            user_dest = os.path.join(user_bin, "credit")
+            if not os.path.isdir(user_bin_dir):
+                os.makedirs(user_bin_dir, exist_ok=True)
+            user_dest = os.path.join(user_bin_dir, "credit")
 
             try:
-                shutil.copy(script_path, user_dest)
-                os.chmod(user_dest, 0o755)
-                console.print(f"[green]Successfully installed at {user_dest}[/green]")
+                install_file(script_path, user_dest, 0o755)
+                messages = [f"[green]Successfully installed at {user_dest}[/green]"]
 
-                if user_bin not in os.environ.get("PATH", "").split(":"):
-                    console.print(
+                path_entries = set(os.environ.get("PATH", "").split(os.pathsep))
+                if user_bin_dir not in path_entries:
+                    messages.append(
                         "[yellow]Add this line to your .bashrc or .zshrc file:[/yellow]"
                     )
-                    console.print(f'[blue]export PATH="$PATH:{user_bin}"[/blue]')
+                    messages.append(f'[blue]export PATH="$PATH:{user_bin_dir}"[/blue]')
+
+                console.print("\n".join(messages))
             except Exception as e2:
                 console.print(
                     f"[red]Error installing to user directory: {str(e2)}[/red]"